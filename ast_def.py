@@ -1,4 +1,6 @@
 # --- AST Node Classes ---
+# Every node except Program records the `line`/`column` of the token it
+# starts at, so later stages (errors, the profiler) can point at source.
 class Program:
     def __init__(self, declarations):
         self.declarations = declarations
@@ -7,120 +9,148 @@ class Program:
         return f"Program(declarations={self.declarations})"
 
 class FunctionDeclaration:
-    def __init__(self, return_type, name, parameters, body):
+    def __init__(self, return_type, name, parameters, body, line=None, column=None):
         self.return_type = return_type
         self.name = name
         self.parameters = parameters
         self.body = body
+        self.line = line
+        self.column = column
 
     def __repr__(self):
         return (f"FunctionDeclaration(return_type={self.return_type}, name={self.name}, "
                 f"params={self.parameters}, body={self.body})")
 
 class Parameter:
-    def __init__(self, param_type, name):
+    def __init__(self, param_type, name, line=None, column=None):
         self.param_type = param_type
         self.name = name
+        self.line = line
+        self.column = column
 
     def __repr__(self):
         return f"Parameter(type={self.param_type}, name={self.name})"
 
 class BlockStatement:
-    def __init__(self, statements):
+    def __init__(self, statements, line=None, column=None):
         self.statements = statements
+        self.line = line
+        self.column = column
 
     def __repr__(self):
         return f"BlockStatement(statements={self.statements})"
 
 class VariableDeclaration:
-    def __init__(self, var_type, name, initializer):
+    def __init__(self, var_type, name, initializer, line=None, column=None):
         self.var_type = var_type
         self.name = name
         self.initializer = initializer
+        self.line = line
+        self.column = column
 
     def __repr__(self):
         return (f"VariableDeclaration(type={self.var_type}, name={self.name}, "
                 f"initializer={self.initializer})")
 
 class ReturnStatement:
-    def __init__(self, expression):
+    def __init__(self, expression, line=None, column=None):
         self.expression = expression
+        self.line = line
+        self.column = column
 
     def __repr__(self):
         return f"ReturnStatement(expression={self.expression})"
 
 class IfStatement:
-    def __init__(self, condition, then_branch, else_branch=None):
+    def __init__(self, condition, then_branch, else_branch=None, line=None, column=None):
         self.condition = condition
         self.then_branch = then_branch
         self.else_branch = else_branch
+        self.line = line
+        self.column = column
 
     def __repr__(self):
         return (f"IfStatement(cond={self.condition}, then={self.then_branch}, "
                 f"else={self.else_branch})")
 
 class WhileStatement:
-    def __init__(self, condition, body):
+    def __init__(self, condition, body, line=None, column=None):
         self.condition = condition
         self.body = body
+        self.line = line
+        self.column = column
 
     def __repr__(self):
         return f"WhileStatement(condition={self.condition}, body={self.body})"
 
 class ForStatement:
-    def __init__(self, init, condition, increment, body):
+    def __init__(self, init, condition, increment, body, line=None, column=None):
         self.init = init
         self.condition = condition
         self.increment = increment
         self.body = body
+        self.line = line
+        self.column = column
 
     def __repr__(self):
         return (f"ForStatement(init={self.init}, condition={self.condition}, "
                 f"increment={self.increment}, body={self.body})")
 
 class ExpressionStatement:
-    def __init__(self, expression):
+    def __init__(self, expression, line=None, column=None):
         self.expression = expression
+        self.line = line
+        self.column = column
 
     def __repr__(self):
         return f"ExpressionStatement(expression={self.expression})"
 
 # --- Expression Nodes ---
 class BinaryExpression:
-    def __init__(self, left, operator, right):
+    def __init__(self, left, operator, right, line=None, column=None):
         self.left = left
         self.operator = operator
         self.right = right
+        self.line = line
+        self.column = column
 
     def __repr__(self):
         return (f"BinaryExpression(left={self.left}, op={self.operator}, "
                 f"right={self.right})")
 
 class FunctionCall:
-    def __init__(self, name, arguments):
+    def __init__(self, name, arguments, line=None, column=None):
         self.name = name
         self.arguments = arguments
+        self.line = line
+        self.column = column
 
     def __repr__(self):
         return f"FunctionCall(name={self.name}, args={self.arguments})"
 
 class Identifier:
-    def __init__(self, name):
+    def __init__(self, name, line=None, column=None):
         self.name = name
+        self.line = line
+        self.column = column
 
     def __repr__(self):
         return f"Identifier(name={self.name})"
 
 class NumberLiteral:
-    def __init__(self, value):
+    def __init__(self, value, line=None, column=None):
         self.value = value
+        self.line = line
+        self.column = column
 
     def __repr__(self):
         return f"NumberLiteral(value={self.value})"
 
 class StringLiteral:
-    def __init__(self, value):
+    def __init__(self, value, line=None, column=None):
         self.value = value
+        self.line = line
+        self.column = column
 
     def __repr__(self):
         return f"StringLiteral(value={self.value})"
@@ -0,0 +1,215 @@
+import sys
+
+from ast_def import *
+
+
+class SimpleLangRuntimeError(Exception):
+    """Custom exception for errors raised while running a program."""
+    pass
+
+
+class _ReturnSignal(Exception):
+    """Unwinds the Python stack when an `output` statement runs."""
+    def __init__(self, value):
+        self.value = value
+
+
+class Environment:
+    """A single variable scope, chained to its enclosing scope."""
+    def __init__(self, parent=None):
+        self.values = {}
+        self.parent = parent
+
+    def define(self, name, value):
+        self.values[name] = value
+
+    def get(self, name):
+        env = self
+        while env is not None:
+            if name in env.values:
+                return env.values[name]
+            env = env.parent
+        raise KeyError(name)
+
+
+# --- Interpreter ---
+class SimpleLangInterpreter:
+    """
+    Tree-walking interpreter for a parsed Program.
+
+    If a `profiler` is given, it is told about every user function call and
+    every executed statement (see profiler.SimpleLangProfiler).
+    """
+    # Each SimpleLang call costs several Python frames, and recursion is the
+    # only way to repeat work, so run() raises Python's limit to this value.
+    RECURSION_LIMIT = 10000
+
+    def __init__(self, program, profiler=None, output=print):
+        self.program = program
+        self.profiler = profiler
+        self.output = output
+        self.globals = Environment()
+        self.functions = {}
+        self.builtins = {"show": self._builtin_show}
+
+    def run(self, entry_point="main"):
+        """
+        Evaluate global declarations, then call `entry_point` and return its result.
+
+        While the program runs, Python's recursion limit is raised to at least
+        RECURSION_LIMIT, whether or not a profiler is attached. This changes
+        interpreter-wide state; the old limit is restored on return.
+        """
+        for decl in self.program.declarations:
+            if isinstance(decl, FunctionDeclaration):
+                self.functions[decl.name] = decl
+        old_limit = sys.getrecursionlimit()
+        sys.setrecursionlimit(max(old_limit, self.RECURSION_LIMIT))
+        try:
+            for decl in self.program.declarations:
+                if isinstance(decl, VariableDeclaration):
+                    self.execute(decl, self.globals)
+            if entry_point not in self.functions:
+                raise SimpleLangRuntimeError(f"No '{entry_point}' function to run.")
+            return self.call_function(self.functions[entry_point], [])
+        finally:
+            sys.setrecursionlimit(old_limit)
+
+    def _error(self, message, node):
+        if node is not None and node.line is not None:
+            message = f"{message} at line {node.line}, col {node.column}"
+        return SimpleLangRuntimeError(message)
+
+    def _builtin_show(self, *args):
+        self.output(*(self._format(a) for a in args))
+
+    def _format(self, value):
+        if value is None:
+            return "nothing"
+        return str(value)
+
+    # --- Calls ---
+    def call_function(self, decl, args, call_node=None):
+        if len(args) != len(decl.parameters):
+            raise self._error(
+                f"Function '{decl.name}' expects {len(decl.parameters)} argument(s) "
+                f"but got {len(args)}", call_node)
+        env = Environment(self.globals)
+        for param, value in zip(decl.parameters, args):
+            env.define(param.name, value)
+
+        profiler = self.profiler
+        if profiler is not None:
+            profiler.enter_function(decl)
+        try:
+            self.execute(decl.body, env)
+        except _ReturnSignal as signal:
+            return signal.value
+        except RecursionError:
+            raise self._error("Maximum call depth exceeded", call_node) from None
+        finally:
+            if profiler is not None:
+                profiler.exit_function()
+        return None
+
+    # --- Statements ---
+    def execute(self, stmt, env):
+        if self.profiler is not None and not isinstance(stmt, BlockStatement):
+            self.profiler.hit_line(stmt.line)
+
+        if isinstance(stmt, BlockStatement):
+            block_env = Environment(env)
+            for s in stmt.statements:
+                self.execute(s, block_env)
+        elif isinstance(stmt, VariableDeclaration):
+            value = None
+            if stmt.initializer is not None:
+                value = self.evaluate(stmt.initializer, env)
+            env.define(stmt.name, value)
+        elif isinstance(stmt, ExpressionStatement):
+            self.evaluate(stmt.expression, env)
+        elif isinstance(stmt, ReturnStatement):
+            value = None
+            if stmt.expression is not None:
+                value = self.evaluate(stmt.expression, env)
+            raise _ReturnSignal(value)
+        elif isinstance(stmt, IfStatement):
+            if self._truthy(self.evaluate(stmt.condition, env)):
+                self.execute(stmt.then_branch, env)
+            elif stmt.else_branch is not None:
+                self.execute(stmt.else_branch, env)
+        elif isinstance(stmt, WhileStatement):
+            while self._truthy(self.evaluate(stmt.condition, env)):
+                self.execute(stmt.body, env)
+                self._hit_loop_header(stmt)
+        elif isinstance(stmt, ForStatement):
+            if stmt.init is not None:
+                self.evaluate(stmt.init, env)
+            while stmt.condition is None or self._truthy(self.evaluate(stmt.condition, env)):
+                self.execute(stmt.body, env)
+                if stmt.increment is not None:
+                    self.evaluate(stmt.increment, env)
+                self._hit_loop_header(stmt)
+        else:
+            raise self._error(f"Cannot execute {type(stmt).__name__}", stmt)
+
+    def _hit_loop_header(self, stmt):
+        """Count each re-evaluation of a loop header as a hit on its line."""
+        if self.profiler is not None:
+            self.profiler.hit_line(stmt.line)
+
+    # --- Expressions ---
+    def evaluate(self, expr, env):
+        if isinstance(expr, NumberLiteral):
+            if "." in expr.value:
+                return float(expr.value)
+            return int(expr.value)
+        if isinstance(expr, StringLiteral):
+            return expr.value
+        if isinstance(expr, Identifier):
+            try:
+                return env.get(expr.name)
+            except KeyError:
+                raise self._error(f"Undefined variable '{expr.name}'", expr) from None
+        if isinstance(expr, BinaryExpression):
+            left = self.evaluate(expr.left, env)
+            right = self.evaluate(expr.right, env)
+            return self._binary(expr, left, right)
+        if isinstance(expr, FunctionCall):
+            args = [self.evaluate(a, env) for a in expr.arguments]
+            if expr.name in self.functions:
+                return self.call_function(self.functions[expr.name], args, expr)
+            if expr.name in self.builtins:
+                return self.builtins[expr.name](*args)
+            raise self._error(f"Undefined function '{expr.name}'", expr)
+        raise self._error(f"Cannot evaluate {type(expr).__name__}", expr)
+
+    def _binary(self, expr, left, right):
+        op = expr.operator
+        try:
+            if op == "+":
+                if isinstance(left, str) or isinstance(right, str):
+                    return self._format(left) + self._format(right)
+                return left + right
+            if op == "-":
+                return left - right
+            if op == "==":
+                return int(left == right)
+            if op == "!=":
+                return int(left != right)
+            if op == "<":
+                return int(left < right)
+            if op == ">":
+                return int(left > right)
+            if op == "<=":
+                return int(left <= right)
+            if op == ">=":
+                return int(left >= right)
+        except TypeError:
+            raise self._error(
+                f"Unsupported operand types for '{op}': "
+                f"{type(left).__name__} and {type(right).__name__}", expr) from None
+        raise self._error(f"Unknown operator '{op}'", expr)
+
+    def _truthy(self, value):
+        return bool(value)
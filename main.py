@@ -1,5 +1,9 @@
+import sys
+
 from lexer import SimpleLangLexer, SimpleLangLexerError
 from parser_ import SimpleLangParser, SimpleLangParserError
+from interpreter import SimpleLangInterpreter, SimpleLangRuntimeError
+from profiler import SimpleLangProfiler
 
 source_code = r"""
 whole add(whole a, whole b) {
@@ -23,19 +27,42 @@ whole main() {
 }
 """
 
-# 1. Lexing
-lexer = SimpleLangLexer(source_code)
-tokens = lexer.get_tokens()
-print("=== TOKENS ===")
-for t in tokens:
-    print(t)
+# Without a script path, the demo program above is run.
+USAGE = "Usage: python main.py [--profile] [script.sl]"
+profile = "--profile" in sys.argv
+unknown_flags = [arg for arg in sys.argv[1:] if arg.startswith("-") and arg != "--profile"]
+script_paths = [arg for arg in sys.argv[1:] if not arg.startswith("-")]
+if unknown_flags or len(script_paths) > 1:
+    sys.exit(f"Unknown argument(s): {' '.join(unknown_flags or script_paths[1:])}\n{USAGE}")
+if script_paths:
+    with open(script_paths[0]) as f:
+        source_code = f.read()
 
-# 2. Parsing
-parser = SimpleLangParser(tokens)
 try:
+    # 1. Lexing
+    lexer = SimpleLangLexer(source_code)
+    tokens = lexer.get_tokens()
+    print("=== TOKENS ===")
+    for t in tokens:
+        print(t)
+
+    # 2. Parsing
+    parser = SimpleLangParser(tokens)
     ast = parser.parse()
     print("\n=== AST ===")
     print(ast)
+
+    # 3. Running (pass --profile to get a source-level profile)
+    profiler = SimpleLangProfiler(source_code) if profile else None
+    print("\n=== OUTPUT ===")
+    SimpleLangInterpreter(ast, profiler=profiler).run()
+    if profiler is not None:
+        print()
+        print(profiler.report())
+        profiler.write_collapsed("profile.folded")
+        print("\nCollapsed stacks written to profile.folded")
+except SimpleLangRuntimeError as e:
+    print("Runtime Error:", e)
 except SimpleLangParserError as e:
     print("Parser Error:", e)
 except SimpleLangLexerError as e:
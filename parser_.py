@@ -83,43 +83,46 @@ class SimpleLangParser:
         type_token = self._expect_type("KEYWORD")
         name_token = self._expect_type("IDENTIFIER")
         if self._peek() and self._peek().value == "(":
-            return self.parse_function_declaration(type_token.value, name_token.value)
+            return self.parse_function_declaration(type_token.value, name_token.value,
+                                                   type_token.line, type_token.column)
         else:
-            return self.parse_global_variable_declaration(type_token.value, name_token.value)
+            return self.parse_global_variable_declaration(type_token.value, name_token.value,
+                                                          type_token.line, type_token.column)
 
-    def parse_function_declaration(self, return_type, func_name):
+    def parse_function_declaration(self, return_type, func_name, line=None, column=None):
         self._expect_value("(")
         parameters = []
         if self._peek() and self._peek().value != ")":
             parameters = self.parse_parameter_list()
         self._expect_value(")")
         body = self.parse_block_statement()
-        return FunctionDeclaration(return_type, func_name, parameters, body)
+        return FunctionDeclaration(return_type, func_name, parameters, body, line, column)
 
     def parse_parameter_list(self):
         params = []
         while True:
             param_type_token = self._expect_type("KEYWORD")
             param_name_token = self._expect_type("IDENTIFIER")
-            params.append(Parameter(param_type_token.value, param_name_token.value))
+            params.append(Parameter(param_type_token.value, param_name_token.value,
+                                    param_type_token.line, param_type_token.column))
             if not self._match(","):
                 break
         return params
 
     def parse_block_statement(self):
-        self._expect_value("{")
+        open_token = self._expect_value("{")
         statements = []
         while self._peek() and self._peek().value != "}":
             statements.append(self.parse_statement())
         self._expect_value("}")
-        return BlockStatement(statements)
+        return BlockStatement(statements, open_token.line, open_token.column)
 
-    def parse_global_variable_declaration(self, var_type, var_name):
+    def parse_global_variable_declaration(self, var_type, var_name, line=None, column=None):
         initializer = None
         if self._match("="):
             initializer = self.parse_expression()
         self._expect_value(";")
-        return VariableDeclaration(var_type, var_name, initializer)
+        return VariableDeclaration(var_type, var_name, initializer, line, column)
 
     def parse_statement(self):
         token = self._peek()
@@ -144,18 +147,19 @@ class SimpleLangParser:
         if self._match("="):
             initializer = self.parse_expression()
         self._expect_value(";")
-        return VariableDeclaration(var_type_token.value, name_token.value, initializer)
+        return VariableDeclaration(var_type_token.value, name_token.value, initializer,
+                                   var_type_token.line, var_type_token.column)
 
     def parse_return_statement(self):
-        self._advance()
+        keyword = self._advance()
         expr = None
         if self._peek() and self._peek().value != ";":
             expr = self.parse_expression()
         self._expect_value(";")
-        return ReturnStatement(expr)
+        return ReturnStatement(expr, keyword.line, keyword.column)
 
     def parse_if_statement(self):
-        self._advance()
+        keyword = self._advance()
         self._expect_value("(")
         condition = self.parse_expression()
         self._expect_value(")")
@@ -164,18 +168,18 @@ class SimpleLangParser:
         if self._peek() and self._peek().value == "otherwise":
             self._advance()
             else_branch = self.parse_statement()
-        return IfStatement(condition, then_branch, else_branch)
+        return IfStatement(condition, then_branch, else_branch, keyword.line, keyword.column)
 
     def parse_while_statement(self):
-        self._advance()
+        keyword = self._advance()
         self._expect_value("(")
         condition = self.parse_expression()
         self._expect_value(")")
         body = self.parse_statement()
-        return WhileStatement(condition, body)
+        return WhileStatement(condition, body, keyword.line, keyword.column)
 
     def parse_for_statement(self):
-        self._advance()
+        keyword = self._advance()
         self._expect_value("(")
         init = None
         if self._peek() and self._peek().value != ";":
@@ -190,12 +194,13 @@ class SimpleLangParser:
             increment = self.parse_expression()
         self._expect_value(")")
         body = self.parse_statement()
-        return ForStatement(init, condition, increment, body)
+        return ForStatement(init, condition, increment, body, keyword.line, keyword.column)
 
     def parse_expression_statement(self):
+        start = self._peek()
         expr = self.parse_expression()
         self._expect_value(";")
-        return ExpressionStatement(expr)
+        return ExpressionStatement(expr, start.line, start.column)
 
     def parse_expression(self):
         return self.parse_comparison_expression()
@@ -207,7 +212,7 @@ class SimpleLangParser:
             if token and token.value in {"==", "!=", "<", ">", "<=", ">="}:
                 op = self._advance().value
                 right = self.parse_additive_expression()
-                expr = BinaryExpression(expr, op, right)
+                expr = BinaryExpression(expr, op, right, token.line, token.column)
             else:
                 break
         return expr
@@ -219,7 +224,7 @@ class SimpleLangParser:
             if token and token.value in {"+", "-"}:
                 op = self._advance().value
                 right = self.parse_primary()
-                expr = BinaryExpression(expr, op, right)
+                expr = BinaryExpression(expr, op, right, token.line, token.column)
             else:
                 break
         return expr
@@ -228,16 +233,16 @@ class SimpleLangParser:
         token = self._peek()
         if token.type == "NUMBER":
             self._advance()
-            return NumberLiteral(token.value)
+            return NumberLiteral(token.value, token.line, token.column)
         if token.type == "STRING_LITERAL":
             self._advance()
-            return StringLiteral(token.value)
+            return StringLiteral(token.value, token.line, token.column)
         if token.type == "IDENTIFIER":
             ident = token.value
             self._advance()
             if self._peek() and self._peek().value == "(":
-                return self.parse_function_call(ident)
-            return Identifier(ident)
+                return self.parse_function_call(ident, token.line, token.column)
+            return Identifier(ident, token.line, token.column)
         if token.value == "(":
             self._advance()
             expr = self.parse_expression()
@@ -245,7 +250,7 @@ class SimpleLangParser:
             return expr
         raise SimpleLangParserError(f"Unexpected token: {token}")
 
-    def parse_function_call(self, func_name):
+    def parse_function_call(self, func_name, line=None, column=None):
         self._expect_value("(")
         args = []
         if self._peek() and self._peek().value != ")":
@@ -254,4 +259,4 @@ class SimpleLangParser:
                 if not self._match(","):
                     break
         self._expect_value(")")
-        return FunctionCall(func_name, args)
\ No newline at end of file
+        return FunctionCall(func_name, args, line, column)
\ No newline at end of file
@@ -0,0 +1,137 @@
+import time
+
+
+class FunctionStats:
+    """Accumulated timings for one FunctionDeclaration."""
+    def __init__(self, name, line):
+        self.name = name
+        self.line = line
+        self.calls = 0
+        self.inclusive_ns = 0
+        self.exclusive_ns = 0
+        self.active = 0  # recursion depth, so recursive calls aren't counted twice
+        self.label = f"{name}:{line}"
+
+    def __repr__(self):
+        return (f"FunctionStats(name={self.name}, line={self.line}, calls={self.calls}, "
+                f"inclusive_ns={self.inclusive_ns}, exclusive_ns={self.exclusive_ns})")
+
+
+class CallTreeNode:
+    """One distinct call stack: exclusive time spent there, keyed children below."""
+    __slots__ = ("exclusive_ns", "children")
+
+    def __init__(self):
+        self.exclusive_ns = 0
+        self.children = {}
+
+    def __repr__(self):
+        return (f"CallTreeNode(exclusive_ns={self.exclusive_ns}, "
+                f"children={list(self.children)})")
+
+
+class _Frame:
+    __slots__ = ("stats", "node", "start", "child_ns")
+
+    def __init__(self, stats, node, start):
+        self.stats = stats
+        self.node = node
+        self.start = start
+        self.child_ns = 0
+
+
+# --- Profiler ---
+class SimpleLangProfiler:
+    """
+    Counting profiler driven by the interpreter.
+
+    The interpreter calls `enter_function`/`exit_function` around every call to a
+    user-defined function and `hit_line` for every statement it executes. Timing
+    is only taken at function boundaries, so per-statement overhead is a single
+    dictionary increment.
+    """
+    def __init__(self, source=None, clock=time.perf_counter_ns):
+        self.source_lines = source.splitlines() if source is not None else None
+        self.clock = clock
+        self.functions = {}
+        self.line_hits = {}
+        self.call_tree = CallTreeNode()
+        self._stack = []
+
+    @property
+    def depth(self):
+        """Number of user function calls currently in progress."""
+        return len(self._stack)
+
+    def enter_function(self, declaration):
+        key = (declaration.name, declaration.line)
+        stats = self.functions.get(key)
+        if stats is None:
+            stats = self.functions[key] = FunctionStats(declaration.name, declaration.line)
+        stats.calls += 1
+        stats.active += 1
+        parent = self._stack[-1].node if self._stack else self.call_tree
+        node = parent.children.get(stats.label)
+        if node is None:
+            node = parent.children[stats.label] = CallTreeNode()
+        self._stack.append(_Frame(stats, node, self.clock()))
+
+    def exit_function(self):
+        frame = self._stack.pop()
+        elapsed = self.clock() - frame.start
+        exclusive = elapsed - frame.child_ns
+        stats = frame.stats
+        stats.active -= 1
+        if stats.active == 0:
+            stats.inclusive_ns += elapsed
+        stats.exclusive_ns += exclusive
+        if self._stack:
+            self._stack[-1].child_ns += elapsed
+        frame.node.exclusive_ns += exclusive
+
+    def hit_line(self, line):
+        if line is not None:
+            self.line_hits[line] = self.line_hits.get(line, 0) + 1
+
+    def collapsed_stacks(self):
+        """
+        Return the profile in the collapsed-stack format read by flamegraph.pl and
+        speedscope: one `frame;frame;frame <nanoseconds>` entry per line, weighted
+        by exclusive time. Stacks with no recorded time are left out.
+        """
+        lines = []
+        # Walk the call tree with an explicit stack: recursive programs make it
+        # as deep as the SimpleLang call depth.
+        pending = [("", self.call_tree)]
+        while pending:
+            path, node = pending.pop()
+            if path and node.exclusive_ns > 0:
+                lines.append(f"{path} {node.exclusive_ns}")
+            for label, child in sorted(node.children.items(), reverse=True):
+                pending.append((f"{path};{label}" if path else label, child))
+        return "\n".join(lines)
+
+    def write_collapsed(self, path):
+        with open(path, "w") as f:
+            f.write(self.collapsed_stacks())
+            f.write("\n")
+
+    def report(self):
+        """Return a human-readable summary of function timings and line hits."""
+        out = ["=== FUNCTIONS ===",
+               f"{'calls':>8} {'incl ms':>10} {'excl ms':>10}  function"]
+        by_exclusive = sorted(self.functions.values(),
+                              key=lambda s: s.exclusive_ns, reverse=True)
+        for s in by_exclusive:
+            out.append(f"{s.calls:>8} {s.inclusive_ns / 1e6:>10.3f} "
+                       f"{s.exclusive_ns / 1e6:>10.3f}  {s.name} (line {s.line})")
+
+        out.append("")
+        out.append("=== LINES ===")
+        out.append(f"{'line':>6} {'hits':>8}  source")
+        for line, hits in sorted(self.line_hits.items()):
+            text = ""
+            if self.source_lines is not None and 0 < line <= len(self.source_lines):
+                text = self.source_lines[line - 1].strip()
+            out.append(f"{line:>6} {hits:>8}  {text}")
+        return "\n".join(out)
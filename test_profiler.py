@@ -0,0 +1,165 @@
+import itertools
+
+import pytest
+
+from lexer import SimpleLangLexer
+from parser_ import SimpleLangParser
+from interpreter import SimpleLangInterpreter, SimpleLangRuntimeError
+from profiler import SimpleLangProfiler
+
+
+FIB_SOURCE = """\
+whole fib(whole n) {
+    check (n < 2) { output n; }
+    output fib(n - 1) + fib(n - 2);
+}
+whole main() {
+    output fib(3);
+}
+"""
+
+
+def run_profiled(source):
+    """Run `source` under a profiler whose clock advances by 1 on every read."""
+    ast = SimpleLangParser(SimpleLangLexer(source).get_tokens()).parse()
+    profiler = SimpleLangProfiler(source, clock=itertools.count().__next__)
+    result = SimpleLangInterpreter(ast, profiler=profiler, output=lambda *args: None).run()
+    return result, profiler
+
+
+def test_recursive_function_timings():
+    result, profiler = run_profiled(FIB_SOURCE)
+    assert result == 2
+
+    main = profiler.functions[("main", 5)]
+    fib = profiler.functions[("fib", 1)]
+    assert (main.calls, fib.calls) == (1, 5)
+    # Clock reads: main enters at 0, the outermost fib runs from 1 to 10, main exits at 11.
+    assert main.inclusive_ns == 11
+    assert fib.inclusive_ns == 9
+    assert main.exclusive_ns == 2
+    assert fib.exclusive_ns == 9
+    assert main.exclusive_ns + fib.exclusive_ns == main.inclusive_ns
+    assert main.active == fib.active == 0
+
+
+def test_collapsed_stacks():
+    _, profiler = run_profiled(FIB_SOURCE)
+    assert profiler.collapsed_stacks().splitlines() == [
+        "main:5 2",
+        "main:5;fib:1 3",
+        "main:5;fib:1;fib:1 4",
+        "main:5;fib:1;fib:1;fib:1 2",
+    ]
+
+
+def test_collapsed_stacks_skip_zero_weight():
+    ast = SimpleLangParser(SimpleLangLexer(FIB_SOURCE).get_tokens()).parse()
+    profiler = SimpleLangProfiler(FIB_SOURCE, clock=lambda: 0)
+    SimpleLangInterpreter(ast, profiler=profiler).run()
+    assert profiler.collapsed_stacks() == ""
+
+
+def test_line_hits():
+    _, profiler = run_profiled(FIB_SOURCE)
+    # Line 2 holds both the check (5 hits) and its `output n` (3 hits).
+    assert profiler.line_hits == {2: 8, 3: 2, 6: 1}
+
+
+def test_loop_header_hits():
+    source = """\
+whole main() {
+    loop (0) { show(1); }
+    iterate (; 0 ;) { show(2); }
+    loop (1) {
+        output 5;
+    }
+}
+"""
+    result, profiler = run_profiled(source)
+    assert result == 5
+    assert profiler.line_hits == {2: 1, 3: 1, 4: 1, 5: 1}
+
+
+def test_runtime_error_leaves_stack_balanced():
+    source = """\
+whole inner() { output missing; }
+whole outer() { output inner(); }
+whole main() { output outer(); }
+"""
+    ast = SimpleLangParser(SimpleLangLexer(source).get_tokens()).parse()
+    profiler = SimpleLangProfiler(source, clock=itertools.count().__next__)
+    with pytest.raises(SimpleLangRuntimeError, match="Undefined variable 'missing'"):
+        SimpleLangInterpreter(ast, profiler=profiler).run()
+    assert profiler.depth == 0
+    assert [s.calls for s in profiler.functions.values()] == [1, 1, 1]
+
+    # A second run with the same profiler starts from the top of the call tree.
+    fib_ast = SimpleLangParser(SimpleLangLexer(FIB_SOURCE).get_tokens()).parse()
+    SimpleLangInterpreter(fib_ast, profiler=profiler).run()
+    assert profiler.collapsed_stacks().splitlines() == [
+        "main:3 2",
+        "main:3;outer:2 2",
+        "main:3;outer:2;inner:1 1",
+        "main:5 2",
+        "main:5;fib:1 3",
+        "main:5;fib:1;fib:1 4",
+        "main:5;fib:1;fib:1;fib:1 2",
+    ]
+
+
+DOWN_SOURCE = """\
+whole down(whole n) { check (n == 0) { output 0; } output down(n - 1); }
+whole main() { output down(%d); }
+"""
+
+
+def test_deep_recursion():
+    result, profiler = run_profiled(DOWN_SOURCE % 400)
+    assert result == 0
+    assert profiler.functions[("down", 1)].calls == 401
+
+
+def test_deep_recursion_call_tree():
+    _, profiler = run_profiled(DOWN_SOURCE % 1000)
+    # One call-tree node and one collapsed line per distinct depth.
+    node, nodes = profiler.call_tree, 0
+    while node.children:
+        assert len(node.children) == 1
+        node = next(iter(node.children.values()))
+        nodes += 1
+    assert nodes == 1002
+    lines = profiler.collapsed_stacks().splitlines()
+    assert len(lines) == 1002
+    assert lines[0].startswith("main:2 ")
+    for depth, line in enumerate(lines[1:], start=1):
+        stack, weight = line.rsplit(" ", 1)
+        assert stack == "main:2" + ";down:1" * depth
+        assert int(weight) > 0
+
+
+def test_deep_recursion_in_global_initializer():
+    source = DOWN_SOURCE.replace("whole main()", "whole start = down(1000);\nwhole main()")
+    result, profiler = run_profiled(source % 0)
+    assert result == 0
+    assert profiler.functions[("down", 1)].calls == 1002
+
+
+def test_recursion_limit_is_a_runtime_error():
+    ast = SimpleLangParser(SimpleLangLexer(DOWN_SOURCE % 100000).get_tokens()).parse()
+    profiler = SimpleLangProfiler(clock=itertools.count().__next__)
+    with pytest.raises(SimpleLangRuntimeError, match="Maximum call depth exceeded"):
+        SimpleLangInterpreter(ast, profiler=profiler).run()
+    assert profiler.depth == 0
+
+    fib_ast = SimpleLangParser(SimpleLangLexer(FIB_SOURCE).get_tokens()).parse()
+    SimpleLangInterpreter(fib_ast, profiler=profiler).run()
+    assert set(profiler.call_tree.children) == {"main:2", "main:5"}
+    fib_lines = [line for line in profiler.collapsed_stacks().splitlines()
+                 if line.startswith("main:5")]
+    assert fib_lines == [
+        "main:5 2",
+        "main:5;fib:1 3",
+        "main:5;fib:1;fib:1 4",
+        "main:5;fib:1;fib:1;fib:1 2",
+    ]